@@ -1,15 +1,25 @@
 # code.py
+import gc
+import os
 import time
 import json
+import struct
 import board
 import busio
 import displayio
 import i2cdisplaybus
 import adafruit_displayio_ssd1306
 from rotary_encoder import RotaryEncoder
-from digitalio import DigitalInOut, Direction, Pull
+import keypad
 import adafruit_adxl34x
+from adafruit_bus_device.i2c_device import I2CDevice
 import neopixel
+from micropython import const
+
+try:
+    import alarm
+except ImportError:
+    alarm = None  # board without deep sleep support
 
 import menu_screens
 import game_engine
@@ -17,11 +27,19 @@ import terminalio
 from adafruit_display_text import label
 
 
-SCORES_FILE = "/scores.json"
+SCORES_DIR = "/scores"  # one <difficulty>_<level>.bin file per level
+# A level's file is its top 5 as packed records: name (NUL padded), score
+SCORE_RECORD = "<10sI"
+SCORE_RECORD_SIZE = struct.calcsize(SCORE_RECORD)
+LEGACY_SCORES_FILE = "/scores.json"  # pre-/scores format, migrated at boot
+LEVELS_DIR = "/levels"
 
-# High score display state
-last_player_score = 0
-last_high_scores = []  # list of {"name": str, "score": int}
+# Probe the filesystem once: a failed open() still walks the VFS, so
+# load_level_config only opens override files that are known to exist.
+try:
+    LEVEL_FILES = set(os.listdir(LEVELS_DIR))
+except OSError:
+    LEVEL_FILES = set()  # no /levels directory on this board
 
 
 # ------------------------
@@ -42,16 +60,90 @@ PIXEL_PIN = board.D2
 # ------------------------
 displayio.release_displays()
 
-i2c = busio.I2C(board.SCL, board.SDA)
-display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
-display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=128, height=64)
+# Default busio clock is 100 kHz, which makes every display push and
+# accelerometer read the slowest part of the loop. 1 MHz is past the
+# 400 kHz rating of both the SSD1306 and the ADXL345, so open_i2c() falls
+# back to fast-mode unless both answer at full speed (long wires / weak
+# pull-ups), or if the port can't clock that fast at all.
+I2C_FREQUENCY = const(1_000_000)
+I2C_FALLBACK_FREQUENCY = const(400_000)
+
+# const() lets the compiler inline these instead of doing global lookups
+DISPLAY_ADDRESS = const(0x3C)
+DISPLAY_WIDTH = const(128)
+DISPLAY_HEIGHT = const(64)
+DISPLAY_NOP = b"\x00\xe3"  # command control byte + SSD1306 NOP
+
+ADXL345_ADDRESS = const(0x53)
+ADXL345_REG_DEVID = b"\x00"
+ADXL345_DEVID = const(0xE5)
+
+
+def open_i2c():
+    """
+    Open the shared bus at I2C_FREQUENCY if the display acknowledges a NOP
+    and the ADXL345 returns its device ID there, otherwise reopen it at
+    I2C_FALLBACK_FREQUENCY.
+    """
+    try:
+        bus = busio.I2C(board.SCL, board.SDA, frequency=I2C_FREQUENCY)
+    except ValueError:
+        # this port can't run the bus at I2C_FREQUENCY
+        return busio.I2C(board.SCL, board.SDA, frequency=I2C_FALLBACK_FREQUENCY)
+    devid = bytearray(1)
+    while not bus.try_lock():
+        pass
+    try:
+        bus.writeto(DISPLAY_ADDRESS, DISPLAY_NOP)
+        bus.writeto_then_readfrom(ADXL345_ADDRESS, ADXL345_REG_DEVID, devid)
+    except OSError:
+        pass  # no ACK: devid stays 0
+    finally:
+        bus.unlock()
+    if devid[0] == ADXL345_DEVID:
+        return bus
+    bus.deinit()
+    return busio.I2C(board.SCL, board.SDA, frequency=I2C_FALLBACK_FREQUENCY)
+
+
+i2c = open_i2c()
+display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=DISPLAY_ADDRESS)
+display = adafruit_displayio_ssd1306.SSD1306(
+    display_bus, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT
+)
+# Push the framebuffer ourselves, once per loop iteration, so every change
+# made during a frame goes out as one coalesced write instead of whatever
+# partial state the background refresh happens to catch.
+display.auto_refresh = False
+
+
+def push_frame():
+    """
+    Refresh the display now.
+    refresh()'s default target_frames_per_second=60 returns False without
+    drawing when the previous call was more than a 60 Hz frame ago, which
+    every caller here is; None drops that frame-rate check.
+    """
+    return display.refresh(target_frames_per_second=None)
+
 
+# main_group holds the splash and the game itself; the other
+# menus are prebuilt once (menu_screens.build_menus) and swapped in whole.
 main_group = displayio.Group()
 display.root_group = main_group
+menus = menu_screens.build_menus()
 
 # Accelerometer (ADXL345)
+# The driver is only used to wake the chip into measurement mode; frames
+# read the data registers directly (see read_accel_y).
 accelerometer = adafruit_adxl34x.ADXL345(i2c)
 
+ADXL345_REG_DATAX0 = b"\x32"           # X0,X1,Y0,Y1,Z0,Z1 follow
+ACCEL_SCALE = 0.004 * 9.80665          # 4 mg/LSB -> m/s^2, same as the driver
+
+accel_device = I2CDevice(i2c, ADXL345_ADDRESS)
+accel_raw = bytearray(6)
+
 # NeoPixel (status LED)
 pixel = neopixel.NeoPixel(PIXEL_PIN, 1, brightness=0.3, auto_write=True)
 pixel[0] = (255, 255, 255)  # default white (menus)
@@ -60,10 +152,12 @@ pixel[0] = (255, 255, 255)  # default white (menus)
 FLASH_INTERVAL = 0.1   # seconds between flashes
 FLASH_COUNT_LIMIT = 6  # total on/off toggles
 
-flash_active = False
-flash_last_time = 0.0
-flash_count = 0
-prev_game_over = False
+# --- Frame pacing ---
+GAME_TICK_NS = const(16_666_666)     # game.update() runs at exactly 60 Hz
+GAME_MAX_CATCHUP = const(4)          # ticks replayed after a stall, at most
+GAME_MAX_SLEEP_NS = const(5_000_000) # keep polling the shoot button between ticks
+GAME_TICKS_PER_DRAW = const(2)       # push a game frame every 2nd tick (30 Hz)
+MENU_FRAME_TIME = 0.01    # menus poll the encoder every 10 ms, even when idle
 
 # ------------------------
 # ENCODER + BUTTONS
@@ -74,94 +168,107 @@ encoder = RotaryEncoder(
     debounce_ms=3,
     pulses_per_detent=3    # encoder only used for menus
 )
-last_encoder_position = encoder.position
-
-button = DigitalInOut(BUTTON_PIN)
-button.direction = Direction.INPUT
-button.pull = Pull.UP
-last_button_state = button.value  # True = released, False = pressed
 
-left_button = DigitalInOut(LEFT_BUTTON_PIN)
-left_button.direction = Direction.INPUT
-left_button.pull = Pull.UP
-last_left_state = left_button.value
-
-right_button = DigitalInOut(RIGHT_BUTTON_PIN)
-right_button.direction = Direction.INPUT
-right_button.pull = Pull.UP
-last_right_state = right_button.value
+# keypad scans and debounces all four buttons (active LOW) in the
+# background; the loop only pops press/release events from its queue.
+keys = keypad.Keys(
+    (BUTTON_PIN, LEFT_BUTTON_PIN, RIGHT_BUTTON_PIN, ENCODER_BUTTON_PIN),
+    value_when_pressed=False,
+    pull=True,
+)
 
-encoder_button = DigitalInOut(ENCODER_BUTTON_PIN)
-encoder_button.direction = Direction.INPUT
-encoder_button.pull = Pull.UP
-last_encoder_button_state = encoder_button.value
+# Button state is kept as one packed word (bit set = held); a key's bit
+# is 1 << its key_number in the Keys pin tuple above.
+MASK_BTN = const(0x01)
+MASK_L = const(0x02)
+MASK_R = const(0x04)
+MASK_ENC = const(0x08)
 
 # ------------------------
-# STATE
+# MENUS
 # ------------------------
-# modes: "main_menu", "difficulty", "level_select", "name_entry", "game", "game_over"
-mode = "main_menu"
-menu_index = 0
-difficulty_index = 0
-level_index = 0           # 0..9 (10 levels)
-game_over_index = 0
-
-selected_difficulty = None
-selected_level = None     # 1..10
-current_level_config = None
-game = None  # Game instance
-
-# Name entry state
+# Option counts are static; hoisting them saves a len() call per tick.
+N_MAIN = len(menu_screens.MAIN_MENU_OPTIONS)
+N_DIFF = len(menu_screens.DIFFICULTY_OPTIONS)
+N_LVL = menu_screens.LEVEL_COUNT
+N_GO = len(menu_screens.GAME_OVER_OPTIONS)
+
+# mode -> (option count, update helper, prebuilt screen) for encoder turns
+MENU_NAV = {
+    "main_menu": (N_MAIN, menu_screens.update_main_menu_selection, menus["main"]),
+    "difficulty": (N_DIFF, menu_screens.update_difficulty_selection, menus["difficulty"]),
+    "level_select": (N_LVL, menu_screens.update_level_selection, menus["level"]),
+    "game_over": (N_GO, menu_screens.update_game_over_selection, menus["game_over"]),
+}
+
+# Name entry
 ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-current_name = ""
-current_char_index = 0  # index into ALPHABET
 MAX_NAME_LENGTH = 10
 
 
 def turn_off_display_and_exit():
-    display.root_group = displayio.Group()
+    # SSD1306 "display off" (0xAE) blanks the panel with a single command
+    # byte instead of pushing an empty 1 KB frame first
+    display.sleep()
     displayio.release_displays()
+
+    # Deep sleep until the main button is pressed; waking resets the board
+    # and code.py starts again from the splash.
+    if alarm is not None:
+        keys.deinit()  # PinAlarm needs the pin unclaimed
+        try:
+            wake = alarm.pin.PinAlarm(pin=BUTTON_PIN, value=False, pull=True)
+            alarm.exit_and_deep_sleep_until_alarms(wake)
+        except ValueError:
+            pass  # pin can't wake this chip, fall back to idling
+
     while True:
-        pass  # halt
+        time.sleep(3600)  # halt without spinning the CPU
+
+
+def read_accel_y() -> float:
+    """
+    Read all six data registers in one I2C transaction and return only Y
+    (the game only uses tilt on that axis).
+    """
+    with accel_device as bus:
+        bus.write_then_readinto(ADXL345_REG_DATAX0, accel_raw)
+    return struct.unpack_from("<h", accel_raw, 2)[0] * ACCEL_SCALE
+
+
+# Base per-difficulty obstacle sizes + scroll speed and max_obstacles
+# differences for generated level configs:
+# (scroll_speed, spawn_interval_frames, max_obstacles, min_length, max_length)
+LEVEL_BASES = {
+    "Easy": (1.0, 28, 3, 28, 48),
+    "Medium": (1.8, 22, 5, 22, 40),
+    "Hard": (2.5, 16, 7, 16, 34),
+}
 
 
 def load_level_config(difficulty_name: str, level_number: int) -> dict:
     """
     Load config for a specific difficulty + level.
     1) Try /levels/<difficulty>_<level>.json  (easy_01.json, hard_10.json, etc.)
+       if it was listed in LEVEL_FILES at boot
     2) If missing, synthesize sensible defaults.
     """
     diff_key = difficulty_name.lower()
     level_str = f"{level_number:02d}"
 
     # 1) Try JSON override
-    filename = "/levels/{}_{}.json".format(diff_key, level_str)
-    try:
-        with open(filename, "r") as f:
-            return json.load(f)
-    except OSError:
-        pass  # no file, fall back to generated config
+    filename = "{}_{}.json".format(diff_key, level_str)
+    if filename in LEVEL_FILES:
+        try:
+            with open(LEVELS_DIR + "/" + filename, "r") as f:
+                return json.load(f)
+        except OSError:
+            pass  # unreadable, fall back to generated config
 
     # 2) Generated config
-    # Base per-difficulty obstacle sizes + scroll speed and max_obstacles differences
-    if difficulty_name == "Easy":
-        base_scroll = 1.0
-        base_spawn = 28
-        base_max_obs = 3
-        obst_min = 28
-        obst_max = 48
-    elif difficulty_name == "Medium":
-        base_scroll = 1.8
-        base_spawn = 22
-        base_max_obs = 5
-        obst_min = 22
-        obst_max = 40
-    else:  # "Hard"
-        base_scroll = 2.5
-        base_spawn = 16
-        base_max_obs = 7
-        obst_min = 16
-        obst_max = 34
+    base_scroll, base_spawn, base_max_obs, obst_min, obst_max = LEVEL_BASES.get(
+        difficulty_name, LEVEL_BASES["Hard"]
+    )
 
     ln = max(1, min(level_number, 10))
 
@@ -184,57 +291,129 @@ def load_level_config(difficulty_name: str, level_number: int) -> dict:
         "tilt_threshold": tilt_threshold,
     }
 
-def load_all_scores():
-    """Load global scores dict from flash."""
+
+def scores_key(difficulty_name: str, level_number: int) -> str:
+    """Scores key / file stem of a level, e.g. "medium_03"."""
+    return "{}_{:02d}".format(difficulty_name.lower(), level_number)
+
+
+def load_level_scores(key: str) -> list:
+    """Load one level's high score list from flash as (name, score) tuples."""
     try:
-        with open(SCORES_FILE, "r") as f:
-            return json.load(f)
+        with open("{}/{}.bin".format(SCORES_DIR, key), "rb") as f:
+            buf = f.read()
     except OSError:
         # file missing
-        return {}
+        return []
+
+    entries = []
+    try:
+        for offset in range(0, len(buf) - SCORE_RECORD_SIZE + 1, SCORE_RECORD_SIZE):
+            name, score = struct.unpack_from(SCORE_RECORD, buf, offset)
+            entries.append((name.rstrip(b"\0").decode(), score))
     except ValueError:
-        # corrupted JSON
-        return {}
+        # corrupted file (UnicodeError is a ValueError)
+        return []
+    return entries
 
 
-def save_all_scores(data):
-    """Save global scores dict to flash."""
+def save_level_scores(key: str, entries: list) -> bool:
+    """
+    Save one level's high score list to flash in a single write.
+    Returns False if the write failed.
+    """
+    buf = bytearray(SCORE_RECORD_SIZE * len(entries))
+    for i, (name, score) in enumerate(entries):
+        struct.pack_into(
+            SCORE_RECORD,
+            buf,
+            i * SCORE_RECORD_SIZE,
+            name.encode(),  # struct truncates / NUL-pads to 10
+            score,
+        )
     try:
-        with open(SCORES_FILE, "w") as f:
-            json.dump(data, f)
+        try:
+            os.mkdir(SCORES_DIR)
+        except OSError:
+            pass  # already there
+        with open("{}/{}.bin".format(SCORES_DIR, key), "wb") as f:
+            f.write(buf)
     except OSError:
         # If write fails, just ignore (no crash)
+        return False
+    return True
+
+
+def migrate_legacy_scores():
+    """
+    One-time move of the old single /scores.json into per-level files.
+    The JSON file is removed once its levels have been written, so this
+    only does any work on the first boot after the format change.
+    """
+    try:
+        with open(LEGACY_SCORES_FILE, "r") as f:
+            data = json.load(f)
+    except OSError:
+        # nothing to migrate
+        return
+    except ValueError:
+        # corrupted JSON: nothing worth keeping
+        data = {}
+
+    try:
+        levels = [
+            (key, [(str(e.get("name", "")), int(e.get("score", 0))) for e in entries[:5]])
+            for key, entries in data.items()
+        ]
+    except (AttributeError, TypeError, ValueError):
+        # valid JSON but not {key: [{"name", "score"}, ...]}: same as corrupted
+        levels = []
+
+    saved = True
+    for key, entries in levels:
+        saved = save_level_scores(key, entries) and saved
+    if not saved:
+        return  # keep the JSON (the only copy) and retry next boot
+    try:
+        os.remove(LEGACY_SCORES_FILE)
+    except OSError:
         pass
 
 
-def update_high_scores(difficulty_name: str, level_number: int, player_name: str, score: int):
+def update_high_scores(cache: dict, difficulty_name: str, level_number: int, player_name: str, score: int):
     """
-    Update high scores for a specific (difficulty, level),
-    keep only top 5, and return the list for that level.
+    Update the in-memory high scores for a specific (difficulty, level),
+    keep only top 5, and return (list for that level, changed).
+    A level's list is read from flash the first time it is needed.
+    Nothing is written here; the caller flushes with save_level_scores()
+    once it is off the game over transition.
     """
-    data = load_all_scores()
-    diff_key = difficulty_name.lower()
-    level_str = f"{level_number:02d}"
-    key = "{}_{}".format(diff_key, level_str)
+    key = scores_key(difficulty_name, level_number)
+    entries = cache.get(key)
+    if entries is None:
+        entries = load_level_scores(key)
+        cache[key] = entries
 
-    entries = data.get(key, [])
-    entries.append({"name": player_name if player_name else "PLAYER", "score": int(score)})
+    # Not in the top 5 (ties go to the older entry): nothing to store
+    if len(entries) >= 5 and int(score) <= entries[-1][1]:
+        return entries, False
 
-    # Sort descending by score
-    entries.sort(key=lambda e: e.get("score", 0), reverse=True)
-    # Keep top 5
-    entries = entries[:5]
-    data[key] = entries
+    entries.append((player_name if player_name else "PLAYER", int(score)))
 
-    save_all_scores(data)
-    return entries
+    # Sort descending by score
+    entries.sort(key=lambda e: e[1], reverse=True)
+    # Keep top 5; at most one entry was added, so drop at most one
+    if len(entries) > 5:
+        entries.pop()
+    return entries, True
 
 
 def run_animated_splash(group, width=128, height=64):
-    """Show 'welcome to dodge game' at top and animate stick figure at bottom."""
-    # clear group
-    while len(group):
-        group.pop()
+    """
+    Show 'welcome to dodge game' at top and animate stick figure at bottom.
+    Runs for about 2 seconds, or until the main button is pressed.
+    """
+    menu_screens.clear_group(group)
 
     # simple 2-color palette
     palette = displayio.Palette(2)
@@ -250,41 +429,15 @@ def run_animated_splash(group, width=128, height=64):
     )
     group.append(title)
 
-    # --- Stick figure bitmap (same design as in Game) ---
-    player_w = 7
-    player_h = 11
-    player_bitmap = displayio.Bitmap(player_w, player_h, 2)
-
-    # Head (3x3) centered at top
-    head_coords = [
-        (2, 0), (3, 0), (4, 0),
-        (2, 1),         (4, 1),
-        (2, 2), (3, 2), (4, 2),
-    ]
-    for x, y in head_coords:
-        player_bitmap[x, y] = 1
-
-    # Body: vertical line
-    for y in range(3, 8):
-        player_bitmap[3, y] = 1
-
-    # Arms: horizontal line
-    for x in range(1, 6):
-        player_bitmap[x, 4] = 1
-
-    # Legs
-    player_bitmap[3, 8] = 1
-    player_bitmap[2, 9] = 1
-    player_bitmap[1, 10] = 1
-
-    player_bitmap[4, 9] = 1
-    player_bitmap[5, 10] = 1
+    # --- Stick figure (the same bitmap the game uses) ---
+    player_w = game_engine.PLAYER_WIDTH
+    player_h = game_engine.PLAYER_HEIGHT
 
     # Place figure near bottom
     start_x = 0
     y_pos = height - player_h - 2
     player_tile = displayio.TileGrid(
-        player_bitmap,
+        game_engine.player_bitmap(),
         pixel_shader=palette,
         x=int(start_x),
         y=int(y_pos),
@@ -296,6 +449,10 @@ def run_animated_splash(group, width=128, height=64):
     dx = 2.0
     start_time = time.monotonic()
     while time.monotonic() - start_time < 2.0:
+        event = keys.events.get()
+        if event is not None and event.pressed and event.key_number == 0:
+            return  # impatient user: skip straight to the menu
+
         x += dx
         if x < 0:
             x = 0
@@ -305,250 +462,385 @@ def run_animated_splash(group, width=128, height=64):
             dx = -dx
 
         player_tile.x = int(x)
+        push_frame()
         time.sleep(0.05)
-# ------------------------
-# SPLASH + INITIAL MAIN MENU
-# ------------------------
-run_animated_splash(main_group, width=128, height=64)
-menu_screens.show_main_menu(main_group, menu_index)
 
 
-# ------------------------
-# MAIN LOOP
-# ------------------------
-while True:
-    # --- ENCODER: MENUS ONLY ---
-    changed = encoder.update()
-    if changed:
-        pos = encoder.position
-        delta = pos - last_encoder_position
-
-        if mode == "main_menu":
-            if delta > 0:
-                menu_index = (menu_index + 1) % len(menu_screens.MAIN_MENU_OPTIONS)
-            elif delta < 0:
-                menu_index = (menu_index - 1) % len(menu_screens.MAIN_MENU_OPTIONS)
-            menu_screens.show_main_menu(main_group, menu_index)
-
-        elif mode == "difficulty":
-            if delta > 0:
-                difficulty_index = (difficulty_index + 1) % len(menu_screens.DIFFICULTY_OPTIONS)
-            elif delta < 0:
-                difficulty_index = (difficulty_index - 1) % len(menu_screens.DIFFICULTY_OPTIONS)
-            menu_screens.show_difficulty_menu(main_group, difficulty_index)
-
-        elif mode == "level_select":
-            if delta > 0:
-                level_index = (level_index + 1) % menu_screens.LEVEL_COUNT
-            elif delta < 0:
-                level_index = (level_index - 1) % menu_screens.LEVEL_COUNT
-            diff_name = menu_screens.DIFFICULTY_OPTIONS[difficulty_index]
-            menu_screens.show_level_menu(main_group, diff_name, level_index)
-
-        elif mode == "game_over":
-            if delta > 0:
-                game_over_index = (game_over_index + 1) % len(menu_screens.GAME_OVER_OPTIONS)
-            elif delta < 0:
-                game_over_index = (game_over_index - 1) % len(menu_screens.GAME_OVER_OPTIONS)
-            menu_screens.show_game_over_menu(
-                main_group,
-                game_over_index,
-                last_player_score,
-                last_high_scores,
-            )
-
-        # NOTE: encoder no longer moves the player at all
-        last_encoder_position = pos
-
-    # --- MAIN BUTTON (edge detect) ---
-    current_button_state = button.value  # True = released, False = pressed
-    if last_button_state and not current_button_state:
-        # just pressed
-        if mode == "main_menu":
-            choice = menu_screens.MAIN_MENU_OPTIONS[menu_index]
-            if choice == "Start Game":
-                mode = "difficulty"
-                last_encoder_position = encoder.position
-                menu_screens.show_difficulty_menu(main_group, difficulty_index)
+def build_level_table() -> dict:
+    """
+    Resolve all 30 (difficulty, level) configs once, so confirming a level
+    never waits on file I/O or the JSON parser.
+    """
+    table = {}
+    for diff in menu_screens.DIFFICULTY_OPTIONS:
+        for level in range(1, N_LVL + 1):
+            table[(diff, level)] = load_level_config(diff, level)
+    return table
+
+
+def main():
+    """
+    Splash, then the input/menu/game loop forever.
+    The loop state and the names used on every pass are locals of this
+    function: on CircuitPython a local is a fast indexed load, while a
+    module global is a dict lookup on every use. Names only touched on a
+    screen change (menus, display, encoder.position, ...) stay globals.
+    """
+    # Hot callables/objects bound once to locals
+    monotonic = time.monotonic
+    monotonic_ns = time.monotonic_ns
+    sleep = time.sleep
+    refresh = push_frame  # draws on every call (no 60 Hz frame check)
+    encoder_update = encoder.update
+    accel_y = read_accel_y
+    next_key_event = keys.events.get_into
+    led = pixel
+    menu_nav = MENU_NAV
+    update_main = menu_screens.update_main_menu_selection
+    update_difficulty = menu_screens.update_difficulty_selection
+    update_level = menu_screens.update_level_selection
+    update_game_over = menu_screens.update_game_over_selection
+    update_name_entry = menu_screens.update_name_entry
+    name_screen = menus["name_entry"]
+
+    # ------------------------
+    # STATE
+    # ------------------------
+    # modes: "main_menu", "difficulty", "level_select", "name_entry", "game", "game_over"
+    mode = "main_menu"
+    # Cursor position of each menu mode; level_select is 0..9 (10 levels)
+    cursor = {"main_menu": 0, "difficulty": 0, "level_select": 0, "game_over": 0}
+
+    selected_difficulty = None
+    selected_level = None     # 1..10
+    current_level_config = None
+    game = None  # Game instance
+    game_update = None  # its bound per-tick methods, set once it exists
+    game_move = None
+
+    # Name entry state
+    current_name = ""
+    current_char_index = 0  # index into ALPHABET
+
+    # High score display state
+    last_player_score = 0
+    last_high_scores = []  # list of (name, score) tuples
+    # Per-level score lists, each read from flash once and flushed only
+    # when changed
+    level_scores = {}
+    scores_dirty = False
+
+    # LED flash state for game over
+    flash_active = False
+    flash_last_time = 0.0
+    flash_count = 0
+    prev_game_over = False
+
+    # Input state
+    last_encoder_position = encoder.position
+    buttons = 0              # packed held-button word, kept from keypad events
+    event = keypad.Event()   # reused for every queue pop
+
+    # Game clock
+    game_last_ns = 0     # monotonic_ns() of the last game clock sample
+    game_accum_ns = 0    # elapsed time not yet consumed by game ticks
+    game_undrawn = 0     # ticks run since the last game frame was pushed
+    redraw = True        # a menu screen changed and has not been pushed yet
+
+    # ------------------------
+    # SPLASH + INITIAL MAIN MENU
+    # ------------------------
+    # The press that skips the splash is consumed there, so it can't
+    # also count as "Start Game"
+    run_animated_splash(main_group, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT)
+    level_table = build_level_table()
+    migrate_legacy_scores()
+
+    update_main(menus["main"], cursor["main_menu"])
+    display.root_group = menus["main"]
+
+    # ------------------------
+    # MAIN LOOP
+    # ------------------------
+    while True:
+        loop_start = monotonic()  # shared by every timer in this pass
+
+        # --- BUTTONS: drain the keypad queue into the packed word ---
+        pressed = 0  # bits that saw a press event since the last pass
+        while next_key_event(event):
+            mask = 1 << event.key_number
+            if event.pressed:
+                buttons |= mask
+                pressed |= mask
             else:
-                turn_off_display_and_exit()
-
-        elif mode == "difficulty":
-            selected_difficulty = menu_screens.DIFFICULTY_OPTIONS[difficulty_index]
-            level_index = 0  # default to Level 1
-            mode = "level_select"
-            last_encoder_position = encoder.position
-            menu_screens.show_level_menu(main_group, selected_difficulty, level_index)
-
-        elif mode == "level_select":
-            # Confirm level selection -> go to name entry
-            selected_level = level_index + 1
-            current_level_config = load_level_config(selected_difficulty, selected_level)
-            current_name = ""
-            current_char_index = 0  # 'A'
-            mode = "name_entry"
-            menu_screens.show_name_entry(
-                main_group,
-                current_name,
-                ALPHABET[current_char_index],
-            )
-            last_encoder_position = encoder.position
-
-        elif mode == "name_entry":
-            # Add current character to name (if not exceeding max length)
-            if len(current_name) < MAX_NAME_LENGTH:
-                current_name += ALPHABET[current_char_index]
-            # Reset current char back to 'A'
-            current_char_index = 0
-            menu_screens.show_name_entry(
-                main_group,
-                current_name,
-                ALPHABET[current_char_index],
-            )
-
-        elif mode == "game" and game is not None:
-            # fire bullet
-            game.handle_button_press()
-
-        elif mode == "game_over":
-            choice = menu_screens.GAME_OVER_OPTIONS[game_over_index]
-            if choice == "Restart":
-                if current_level_config is not None:
+                buttons &= ~mask
+
+        # --- ENCODER: MENUS ONLY (not even sampled during gameplay) ---
+        if mode != "game" and encoder_update():
+            redraw = True
+            pos = encoder.position
+            delta = pos - last_encoder_position
+
+            # Screens are already drawn; only touch the rows that changed
+            nav = menu_nav.get(mode)
+            if nav is not None and delta:
+                count, update, screen = nav
+                index = (cursor[mode] + (1 if delta > 0 else -1)) % count
+                cursor[mode] = index
+                update(screen, index)
+
+            # NOTE: encoder no longer moves the player at all
+            last_encoder_position = pos
+
+        # --- MAIN BUTTON ---
+        if pressed & MASK_BTN:
+            redraw = True
+            if mode == "main_menu":
+                choice = menu_screens.MAIN_MENU_OPTIONS[cursor["main_menu"]]
+                if choice == "Start Game":
+                    mode = "difficulty"
+                    last_encoder_position = encoder.position
+                    update_difficulty(menus["difficulty"], cursor["difficulty"])
+                    display.root_group = menus["difficulty"]
+                else:
+                    turn_off_display_and_exit()
+
+            elif mode == "difficulty":
+                selected_difficulty = menu_screens.DIFFICULTY_OPTIONS[cursor["difficulty"]]
+                cursor["level_select"] = 0  # default to Level 1
+                mode = "level_select"
+                last_encoder_position = encoder.position
+                menu_screens.update_level_menu_difficulty(menus["level"], selected_difficulty)
+                update_level(menus["level"], 0)
+                display.root_group = menus["level"]
+
+            elif mode == "level_select":
+                # Confirm level selection -> go to name entry
+                selected_level = cursor["level_select"] + 1
+                current_level_config = level_table[(selected_difficulty, selected_level)]
+                current_name = ""
+                current_char_index = 0  # 'A'
+                mode = "name_entry"
+                display.root_group = name_screen
+                update_name_entry(
+                    name_screen,
+                    current_name,
+                    ALPHABET[current_char_index],
+                )
+                last_encoder_position = encoder.position
+
+            elif mode == "name_entry":
+                # Add current character to name (if not exceeding max length)
+                if len(current_name) < MAX_NAME_LENGTH:
+                    current_name += ALPHABET[current_char_index]
+                # Reset current char back to 'A'
+                current_char_index = 0
+                update_name_entry(
+                    name_screen,
+                    current_name,
+                    ALPHABET[current_char_index],
+                )
+
+            elif mode == "game" and game is not None:
+                # fire bullet
+                game.handle_button_press()
+
+            elif mode == "game_over":
+                # Leaving the game over screen either way: write the new
+                # score to flash now, off the end-of-round transition
+                if scores_dirty:
+                    save_level_scores(
+                        scores_key(selected_difficulty, selected_level),
+                        last_high_scores,
+                    )
+                    scores_dirty = False
+                choice = menu_screens.GAME_OVER_OPTIONS[cursor["game_over"]]
+                if choice == "Restart":
+                    if current_level_config is not None:
+                        game.reset(current_level_config, player_name=current_name)
+                        display.root_group = main_group
+                        gc.collect()  # collect now, not mid-frame
+                        game_last_ns = monotonic_ns()
+                        game_accum_ns = 0
+                        game_undrawn = 0
+                        mode = "game"
+                        prev_game_over = False
+                        flash_active = False
+                        flash_count = 0
+                        last_encoder_position = encoder.position
+                else:  # "Main Menu"
+                    mode = "main_menu"
+                    cursor["main_menu"] = 0
+                    update_main(menus["main"], 0)
+                    display.root_group = menus["main"]
+                    last_encoder_position = encoder.position
+
+        # --- ENCODER BUTTON (finish name entry) ---
+        if pressed & MASK_ENC:
+            redraw = True
+            if mode == "name_entry" and current_level_config is not None:
+                # If name is empty, allow that, or you could default to "PLAYER"
+                # Create the game on first use, afterwards recycle the instance
+                if game is None:
                     game = game_engine.Game(
                         main_group,
                         current_level_config,
                         player_name=current_name,
                     )
-                    mode = "game"
-                    prev_game_over = False
-                    flash_active = False
-                    flash_count = 0
-                    last_encoder_position = encoder.position
-            else:  # "Main Menu"
-                mode = "main_menu"
-                menu_index = 0
-                menu_screens.show_main_menu(main_group, menu_index)
+                    game_update = game.update
+                    game_move = game.handle_encoder_delta
+                else:
+                    game.reset(current_level_config, player_name=current_name)
+                display.root_group = main_group
+                gc.collect()  # collect now, not mid-frame
+                game_last_ns = monotonic_ns()
+                game_accum_ns = 0
+                game_undrawn = 0
+                mode = "game"
+                prev_game_over = False
+                flash_active = False
+                flash_count = 0
                 last_encoder_position = encoder.position
 
-    last_button_state = current_button_state
-
-    # --- ENCODER BUTTON (finish name entry) ---
-    current_enc_btn_state = encoder_button.value
-    if last_encoder_button_state and not current_enc_btn_state:
-        # pressed
-        if mode == "name_entry" and current_level_config is not None:
-            # If name is empty, allow that, or you could default to "PLAYER"
-            # Create game with current_name
-            game = game_engine.Game(
-                main_group,
-                current_level_config,
-                player_name=current_name,
-            )
-            mode = "game"
-            prev_game_over = False
-            flash_active = False
-            flash_count = 0
-            last_encoder_position = encoder.position
-    last_encoder_button_state = current_enc_btn_state
-
-    # --- NAME ENTRY: LEFT/RIGHT CHANGE CHAR (edge detect) ---
-    if mode == "name_entry":
-        current_left_state = left_button.value
-        current_right_state = right_button.value
-
-        # left button: previous letter
-        if last_left_state and not current_left_state:
-            current_char_index = (current_char_index - 1) % len(ALPHABET)
-            menu_screens.show_name_entry(
-                main_group,
-                current_name,
-                ALPHABET[current_char_index],
-            )
-
-        # right button: next letter
-        if last_right_state and not current_right_state:
-            current_char_index = (current_char_index + 1) % len(ALPHABET)
-            menu_screens.show_name_entry(
-                main_group,
-                current_name,
-                ALPHABET[current_char_index],
-            )
-
-        last_left_state = current_left_state
-        last_right_state = current_right_state
-    else:
-        # still update last states so edges are correct when re-entering name_entry
-        last_left_state = left_button.value
-        last_right_state = right_button.value
-
-    # --- GAME UPDATE (movement + obstacles) ---
-    if mode == "game" and game is not None:
-        # Left/right movement via buttons (active LOW)
-        if not left_button.value:
-            game.handle_encoder_delta(-1)   # move left
-        if not right_button.value:
-            game.handle_encoder_delta(1)    # move right
-
-        ax, ay, az = accelerometer.acceleration
-        now = time.monotonic()
-        game.update(ay, now)
-
-        # Detect transition into game_over
-        if game.game_over and not prev_game_over:
-            # Update high scores for this (difficulty, level)
-            last_player_score = game.score
-            # selected_difficulty and selected_level are already tracked
-            last_high_scores = update_high_scores(
-                selected_difficulty,
-                selected_level,
-                current_name,
-                last_player_score,
-            )
-
-            mode = "game_over"
-            game_over_index = 0
-            menu_screens.show_game_over_menu(
-                main_group,
-                game_over_index,
-                last_player_score,
-                last_high_scores,
-            )
-
-            # start LED flash sequence
-            flash_active = True
-            flash_last_time = now
-            flash_count = 0
-
-        prev_game_over = game.game_over
-
-
-    # --- PIXEL LED STATE ---
-    now = time.monotonic()
-
-    if flash_active:
-        # Flashing red on/off
-        if now - flash_last_time >= FLASH_INTERVAL:
-            flash_last_time = now
-            flash_count += 1
-
-            if flash_count % 2 == 1:
-                pixel[0] = (255, 0, 0)   # red
-            else:
-                pixel[0] = (0, 0, 0)     # off
-
-            if flash_count >= FLASH_COUNT_LIMIT:
-                flash_active = False
-    else:
-        # Normal LED state
-        if game is not None and game.game_over:
-            pixel[0] = (255, 0, 0)         # solid red
-        elif mode == "game" and game is not None:
-            if game.bullets > 0:
-                pixel[0] = (255, 255, 0)   # yellow
+        # --- NAME ENTRY: LEFT/RIGHT CHANGE CHAR (edge detect) ---
+        if mode == "name_entry":
+            # left button: previous letter
+            if pressed & MASK_L:
+                redraw = True
+                current_char_index = (current_char_index - 1) % len(ALPHABET)
+                update_name_entry(
+                    name_screen,
+                    current_name,
+                    ALPHABET[current_char_index],
+                )
+
+            # right button: next letter
+            if pressed & MASK_R:
+                redraw = True
+                current_char_index = (current_char_index + 1) % len(ALPHABET)
+                update_name_entry(
+                    name_screen,
+                    current_name,
+                    ALPHABET[current_char_index],
+                )
+
+        # --- GAME UPDATE (movement + obstacles) ---
+        if mode == "game" and game is not None:
+            # Fixed timestep: run one update per elapsed 60 Hz tick (capped after
+            # a stall), then draw once below, so game speed no longer depends on
+            # how long display pushes or I2C reads take.
+            now_ns = monotonic_ns()
+            game_accum_ns += now_ns - game_last_ns
+            game_last_ns = now_ns
+            if game_accum_ns > GAME_MAX_CATCHUP * GAME_TICK_NS:
+                game_accum_ns = GAME_MAX_CATCHUP * GAME_TICK_NS
+
+            if game_accum_ns >= GAME_TICK_NS:
+                # Left/right movement via buttons (active LOW), applied per tick
+                left_held = buttons & MASK_L
+                right_held = buttons & MASK_R
+                now_ms = now_ns // 1_000_000
+                # Tilt is ignored while the game's tilt cooldown runs, so
+                # skip the I2C read then (0.0 is inside any threshold)
+                if now_ms - game.last_tilt_ms > game.tilt_cooldown_ms:
+                    ay = accel_y()
+                else:
+                    ay = 0.0
+
+                while game_accum_ns >= GAME_TICK_NS:
+                    if left_held:
+                        game_move(-1)   # move left
+                    if right_held:
+                        game_move(1)    # move right
+                    game_update(ay, now_ms)
+                    game_accum_ns -= GAME_TICK_NS
+                    game_undrawn += 1
+
+            # Detect transition into game_over
+            if game.game_over and not prev_game_over:
+                # Update high scores for this (difficulty, level)
+                last_player_score = game.score
+                # selected_difficulty and selected_level are already tracked
+                last_high_scores, changed = update_high_scores(
+                    level_scores,
+                    selected_difficulty,
+                    selected_level,
+                    current_name,
+                    last_player_score,
+                )
+                scores_dirty = scores_dirty or changed
+
+                mode = "game_over"
+                cursor["game_over"] = 0
+                # encoder was not polled during the game: resync so the first
+                # menu delta starts from 0
+                last_encoder_position = encoder.position
+                menu_screens.update_game_over_scores(
+                    menus["game_over"],
+                    last_player_score,
+                    last_high_scores,
+                )
+                update_game_over(menus["game_over"], 0)
+                display.root_group = menus["game_over"]
+                redraw = True
+
+                # start LED flash sequence
+                flash_active = True
+                flash_last_time = loop_start
+                flash_count = 0
+
+            prev_game_over = game.game_over
+
+        # --- PIXEL LED STATE ---
+        if flash_active:
+            # Flashing red on/off
+            if loop_start - flash_last_time >= FLASH_INTERVAL:
+                flash_last_time = loop_start
+                flash_count += 1
+
+                if flash_count % 2 == 1:
+                    led[0] = (255, 0, 0)   # red
+                else:
+                    led[0] = (0, 0, 0)     # off
+
+                if flash_count >= FLASH_COUNT_LIMIT:
+                    flash_active = False
+        else:
+            # Normal LED state
+            if game is not None and game.game_over:
+                led[0] = (255, 0, 0)         # solid red
+            elif mode == "game" and game is not None:
+                if game.bullets > 0:
+                    led[0] = (255, 255, 0)   # yellow
+                else:
+                    led[0] = (0, 255, 0)     # green
             else:
-                pixel[0] = (0, 255, 0)     # green
+                # any menu / splash / name entry / level select
+                led[0] = (255, 255, 255)     # white
+
+        # --- DISPLAY: at most one framebuffer push per iteration ---
+        # Menus only change on input, so a static screen is never re-sent.
+        # In game mode every tick's tile moves are coalesced into one push
+        # per GAME_TICKS_PER_DRAW ticks: the I2C transfer is the bulk of a
+        # frame, and 30 Hz is plenty for 1-pixel obstacles.
+        if mode != "game":
+            # keep redraw set until a refresh has really drawn the screen
+            if redraw and refresh():
+                redraw = False
+        elif game_undrawn >= GAME_TICKS_PER_DRAW:
+            refresh()
+            game_undrawn = 0
+
+        # --- FRAME PACING: sleep only what is left of this frame ---
+        if mode == "game":
+            # until the next tick is due, but wake at least every 5 ms
+            remaining = min(GAME_TICK_NS - game_accum_ns, GAME_MAX_SLEEP_NS) / 1_000_000_000
         else:
-            # any menu / splash / name entry / level select
-            pixel[0] = (255, 255, 255)     # white
+            # the encoder is decoded by polling, so a longer idle sleep
+            # would drop the quadrature steps of the first turn after it
+            remaining = loop_start + MENU_FRAME_TIME - monotonic()
+        if remaining > 0:
+            sleep(remaining)
+
 
-    time.sleep(0.01)
+main()
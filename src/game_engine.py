@@ -1,4 +1,5 @@
 # game_engine.py
+import array
 import displayio
 import random
 import terminalio
@@ -6,23 +7,83 @@ from adafruit_display_text import label
 
 
 def clear_group(group: displayio.Group) -> None:
-    while len(group):
+    # Group has no slice delete; pop from the end, taking len() only once
+    for _ in range(len(group)):
         group.pop()
 
 
+# Stick figure bitmap size
+PLAYER_WIDTH = 7
+PLAYER_HEIGHT = 11
+
+_player_bitmap = None
+
+
+def player_bitmap() -> displayio.Bitmap:
+    """
+    The player's stick figure, drawn on first use and then shared:
+    the splash and every round show the same (read-only) bitmap.
+    """
+    global _player_bitmap
+    if _player_bitmap is not None:
+        return _player_bitmap
+
+    bitmap = displayio.Bitmap(PLAYER_WIDTH, PLAYER_HEIGHT, 2)
+
+    # Draw a simple stick figure:
+    #  - head: 3x3 block centered at top
+    #  - body: vertical line
+    #  - arms: horizontal line
+    #  - legs: diagonal-ish lines
+    #
+    # Coordinate system: (x, y) where x in [0..6], y in [0..10]
+
+    # Head (3x3) roughly centered at top, rows y=0..2
+    head_coords = [
+        (2, 0), (3, 0), (4, 0),
+        (2, 1),         (4, 1),
+        (2, 2), (3, 2), (4, 2),
+    ]
+    for x, y in head_coords:
+        bitmap[x, y] = 1
+
+    # Body: vertical line down from head center (x=3, y=3..7)
+    for y in range(3, 8):
+        bitmap[3, y] = 1
+
+    # Arms: horizontal line at y=4 (from x=1..5)
+    for x in range(1, 6):
+        bitmap[x, 4] = 1
+
+    # Legs: two lines from (3,8) to (1,10) and (5,10)
+    bitmap[3, 8] = 1
+    bitmap[2, 9] = 1
+    bitmap[1, 10] = 1
+
+    bitmap[4, 9] = 1
+    bitmap[5, 10] = 1
+
+    _player_bitmap = bitmap
+    return bitmap
+
+
 class Game:
     """
     Dodging game (no display_shapes, only displayio):
 
     - Player: stick figure bitmap (7x11)
-    - Obstacles: 1-pixel-high horizontal bitmaps moving down
+    - Obstacles: 1-pixel-high horizontal strips moving down, drawn by a
+      pool of TileGrids that stay in the group (no per-spawn allocation)
     - Left/right movement: via handle_encoder_delta() (called from buttons)
     - Vertical movement: via tilt (accelerometer Y)
     - Every 4 dodged obstacles -> +1 bullet (max 3)
     - Button: spend 1 bullet to destroy one obstacle
     - Bullets shown as small vertical bars at top-right
-    - scroll_speed may be float; positions stored as float but drawn as int
+    - scroll_speed may be float; obstacle positions are stored as integer
+      1/16-pixel fixed point (Q4) and drawn as y >> 4
     - Player name + score shown at the top of the screen
+    - reset() starts a new round on the same instance, reusing every
+      TileGrid/Label instead of rebuilding the display tree
     """
 
     def __init__(
@@ -37,30 +98,17 @@ class Game:
         self.width = width
         self.height = height
 
-        clear_group(self.root_group)
         self.group = displayio.Group()
-        self.root_group.append(self.group)
-
-        # ----- Level parameters from JSON -----
-        self.scroll_speed = float(level_config.get("scroll_speed", 1.0))
-        self.spawn_interval = int(level_config.get("spawn_interval_frames", 20))
-        self.max_obstacles = int(level_config.get("max_obstacles", 5))
-        self.obstacle_min_length = int(level_config.get("obstacle_min_length", 20))
-        self.obstacle_max_length = int(level_config.get("obstacle_max_length", 50))
 
         # Shared palette: index 0 = black, 1 = white
         self.palette = displayio.Palette(2)
         self.palette[0] = 0x000000
         self.palette[1] = 0xFFFFFF
 
-        # ----- Score + Name -----
-        self.player_name = player_name if player_name else "PLAYER"
-        self.score = 0
-
-        # Name + score label at top
+        # Name + score label at top (text is set by reset())
         self.name_score_label = label.Label(
             terminalio.FONT,
-            text=self._make_name_score_text(),
+            text="",
             x=2,
             y=8,
         )
@@ -68,71 +116,33 @@ class Game:
 
         # ----- Player (stick figure) -----
         # Stick figure bitmap size
-        self.player_width = 7
-        self.player_height = 11
+        self.player_width = PLAYER_WIDTH
+        self.player_height = PLAYER_HEIGHT
 
         self.horizontal_step = 3
         self.vertical_step = self.height // 4  # 1/4 screen per tilt
-        self.vertical_level = 0                # 0..2
         self.bottom_y = self.height - self.player_height - 2
 
-        self.player_x = float(self.width // 2)
-        self.player_y = float(self.bottom_y)
-
-        player_bitmap = displayio.Bitmap(self.player_width, self.player_height, 2)
-
-        # Draw a simple stick figure:
-        #  - head: 3x3 block centered at top
-        #  - body: vertical line
-        #  - arms: horizontal line
-        #  - legs: diagonal-ish lines
-        #
-        # Coordinate system: (x, y) where x in [0..6], y in [0..10]
-
-        # Head (3x3) roughly centered at top, rows y=0..2
-        head_coords = [
-            (2, 0), (3, 0), (4, 0),
-            (2, 1),         (4, 1),
-            (2, 2), (3, 2), (4, 2),
-        ]
-        for x, y in head_coords:
-            player_bitmap[x, y] = 1
-
-        # Body: vertical line down from head center (x=3, y=3..7)
-        for y in range(3, 8):
-            player_bitmap[3, y] = 1
-
-        # Arms: horizontal line at y=4 (from x=1..5)
-        for x in range(1, 6):
-            player_bitmap[x, 4] = 1
-
-        # Legs: two lines from (3,8) to (1,10) and (5,10)
-        player_bitmap[3, 8] = 1
-        player_bitmap[2, 9] = 1
-        player_bitmap[1, 10] = 1
-
-        player_bitmap[4, 9] = 1
-        player_bitmap[5, 10] = 1
+        # Whole pixels: the player only moves in integer steps
+        self.player_x = self.width // 2
+        self.player_y = self.bottom_y
 
         self.player_tile = displayio.TileGrid(
-            player_bitmap,
+            player_bitmap(),
             pixel_shader=self.palette,
-            x=int(self.player_x),
-            y=int(self.player_y),
+            x=self.player_x,
+            y=self.player_y,
         )
         self.group.append(self.player_tile)
 
         # ----- Bullets UI -----
-        self.bullets = 0
         self.max_bullets = 3
         self.bullet_slots = []
 
         bullet_w = 2
         bullet_h = 6
         bullet_bitmap = displayio.Bitmap(bullet_w, bullet_h, 2)
-        for yy in range(bullet_h):
-            for xx in range(bullet_w):
-                bullet_bitmap[xx, yy] = 1
+        bullet_bitmap.fill(1)  # solid bar, filled in C
 
         # place bullets a bit lower so they don't overlap name/score
         for i in range(self.max_bullets):
@@ -144,18 +154,99 @@ class Game:
             )
             self.group.append(tile)
             self.bullet_slots.append(tile)
+
+        # ----- Obstacles -----
+        # Parallel arrays, one slot per obstacle, oldest first; only the first
+        # obs_count slots are live. Sized to max_obstacles by reset().
+        self.obs_y = array.array("h")    # top edge in Q4 (1/16 px)
+        self.obs_x = array.array("h")    # left edge
+        self.obs_w = array.array("h")    # length in pixels
+        self.obs_tiles = []              # TileGrid per slot (None when free)
+        self.obs_count = 0
+
+        # Obstacle TileGrids are pooled: each is added to the group once and
+        # hidden while unused. A TileGrid can't be resized, so each one is a
+        # row of `width` 1x1 tiles over a 2-pixel strip (0 = transparent,
+        # 1 = white) and its length is the number of leading white tiles.
+        self._strip = displayio.Bitmap(2, 1, 2)
+        self._strip[1, 0] = 1
+        self._strip_palette = displayio.Palette(2)
+        self._strip_palette[0] = 0x000000
+        self._strip_palette[1] = 0xFFFFFF
+        self._strip_palette.make_transparent(0)
+        self._free_tiles = []            # hidden pool TileGrids
+        self._free_lengths = []          # white tiles each one still has set
+
+        self.tilt_cooldown_ms = 300
+
+        self.reset(level_config, player_name)
+
+    def reset(self, level_config: dict, player_name: str = ""):
+        """
+        Start a new round with the given level config.
+        Only state is reinitialized; the existing TileGrids are moved back
+        into place, so a Restart allocates (almost) nothing.
+        """
+        # The splash draws into the shared root group, so re-attach if needed
+        if len(self.root_group) != 1 or self.root_group[0] is not self.group:
+            clear_group(self.root_group)
+            self.root_group.append(self.group)
+
+        # ----- Level parameters from JSON -----
+        self.scroll_speed = float(level_config.get("scroll_speed", 1.0))
+        # px/frame in Q4, so the per-frame obstacle step is a small-int add
+        self.scroll_q4 = int(round(self.scroll_speed * 16))
+        self.spawn_interval = int(level_config.get("spawn_interval_frames", 20))
+        self.max_obstacles = int(level_config.get("max_obstacles", 5))
+        self.obstacle_min_length = int(level_config.get("obstacle_min_length", 20))
+        self.obstacle_max_length = int(level_config.get("obstacle_max_length", 50))
+        self._length_range = self.obstacle_max_length - self.obstacle_min_length + 1
+
+        # ----- Score + Name -----
+        self.player_name = player_name if player_name else "PLAYER"
+        self.score = 0
+        self._update_name_score_label()
+
+        # ----- Player back to bottom center -----
+        self.vertical_level = 0                # 0..2
+        self.player_x = self.width // 2
+        self._update_player_pos()
+
+        # ----- Bullets -----
+        self.bullets = 0
         self._update_bullet_display()
 
         # ----- Obstacles -----
-        # each obstacle: {"tile": TileGrid, "y": float, "x": float, "width": int, "dodged": bool}
-        self.obstacles = []
-        self.frame_count = 0
+        for i in range(self.obs_count):
+            self._free_obstacle(i)
+        self.obs_count = 0
+        while len(self._free_tiles) < self.max_obstacles:
+            tile = displayio.TileGrid(
+                self._strip,
+                pixel_shader=self._strip_palette,
+                width=self.width,
+                height=1,
+                tile_width=1,
+                tile_height=1,
+            )
+            tile.hidden = True
+            self.group.append(tile)
+            self._free_tiles.append(tile)
+            self._free_lengths.append(0)
+        if len(self.obs_tiles) != self.max_obstacles:
+            n = self.max_obstacles
+            self.obs_y = array.array("h", [0] * n)
+            self.obs_x = array.array("h", [0] * n)
+            self.obs_w = array.array("h", [0] * n)
+            self.obs_tiles = [None] * n
+        # Frames until the next spawn; a spawn_interval <= 0 goes negative
+        # at once and never reaches 0 again, i.e. never spawns
+        self.spawn_countdown = self.spawn_interval
         self.dodged_count = 0
 
         # ----- Tilt config -----
         self.tilt_threshold = float(level_config.get("tilt_threshold", 3.0))
-        self.tilt_cooldown = 0.3  # seconds
-        self.last_tilt_time = 0.0
+        self.last_tilt_ms = 0
 
         # ----- Game over flag -----
         self.game_over = False
@@ -163,7 +254,9 @@ class Game:
     # ------- helper methods -------
 
     def _make_name_score_text(self) -> str:
-        return "{}  S:{}".format(self.player_name, self.score)
+        # Rebuilt on every score change: plain concatenation skips the
+        # format-string parser
+        return self.player_name + "  S:" + str(self.score)
 
     def _update_name_score_label(self):
         if self.name_score_label is not None:
@@ -176,17 +269,16 @@ class Game:
         if self.vertical_level > 2:
             self.vertical_level = 2
 
-        self.player_y = float(self.bottom_y - self.vertical_level * self.vertical_step)
+        self.player_y = self.bottom_y - self.vertical_level * self.vertical_step
 
         # Clamp x for player
         if self.player_x < 0:
-            self.player_x = 0.0
+            self.player_x = 0
         if self.player_x > self.width - self.player_width:
-            self.player_x = float(self.width - self.player_width)
+            self.player_x = self.width - self.player_width
 
-        # Apply to TileGrid using ints
-        self.player_tile.x = int(self.player_x)
-        self.player_tile.y = int(self.player_y)
+        self.player_tile.x = self.player_x
+        self.player_tile.y = self.player_y
 
     def _update_bullet_display(self):
         # Show bullets by moving their TileGrids on/off screen
@@ -197,85 +289,116 @@ class Game:
                 tile.x = self.width + 10  # off-screen
 
     def _spawn_obstacle(self):
-        if len(self.obstacles) >= self.max_obstacles:
+        i = self.obs_count
+        if i >= self.max_obstacles:
             return
 
-        length = random.randint(self.obstacle_min_length, self.obstacle_max_length)
-        x = float(random.randint(0, self.width - length))
-        y = 0.0
+        # One PRNG step each instead of randint()'s range checks; both ranges
+        # are < 256 so 8 random bits are enough
+        length = self.obstacle_min_length + random.getrandbits(8) % self._length_range
+        x = random.getrandbits(8) % (self.width - length + 1)
+
+        # Take a pooled tile and only flip the tiles between its old
+        # and new length
+        tile = self._free_tiles.pop()
+        drawn = self._free_lengths.pop()
+        for xx in range(drawn, length):
+            tile[xx] = 1
+        for xx in range(length, drawn):
+            tile[xx] = 0
+        tile.x = x
+        tile.y = 0
+        tile.hidden = False
+
+        self.obs_y[i] = 0
+        self.obs_x[i] = x
+        self.obs_w[i] = length
+        self.obs_tiles[i] = tile
+        self.obs_count = i + 1
+
+    def _free_obstacle(self, i):
+        # Hide slot i's tile and return it to the pool (the caller compacts)
+        tile = self.obs_tiles[i]
+        tile.hidden = True
+        self._free_tiles.append(tile)
+        self._free_lengths.append(self.obs_w[i])
+        self.obs_tiles[i] = None
 
-        bitmap = displayio.Bitmap(length, 1, 2)
-        for xx in range(length):
-            bitmap[xx, 0] = 1
-
-        tile = displayio.TileGrid(
-            bitmap,
-            pixel_shader=self.palette,
-            x=int(x),
-            y=int(y),
-        )
-        self.group.append(tile)
+    def _handle_obstacles(self):
+        if self.game_over:
+            return
 
-        self.obstacles.append(
-            {"tile": tile, "y": y, "x": x, "width": length, "dodged": False}
-        )
+        obs_y = self.obs_y
+        obs_x = self.obs_x
+        obs_w = self.obs_w
+        tiles = self.obs_tiles
+        count = self.obs_count
+        speed = self.scroll_q4
+        height = self.height
 
-    def _check_collision(self, obs):
-        # Player AABB (now using width/height of stick figure)
-        px0 = int(self.player_x)
+        # Player AABB (stick figure), fixed for the whole pass
+        px0 = self.player_x
         px1 = px0 + self.player_width
-        py0 = int(self.player_y)
+        py0 = self.player_y
         py1 = py0 + self.player_height
 
-        # Obstacle rectangle (1 pixel tall)
-        oy = int(obs["y"])
-        ox0 = int(obs["x"])
-        ox1 = ox0 + obs["width"]
-        oy0 = oy
-        oy1 = oy + 1
-
-        return (px0 < ox1 and px1 > ox0 and py0 < oy1 and py1 > oy0)
-
-    def _handle_obstacles(self):
-        if self.game_over:
-            return
-
-        to_remove = []
-
-        for obs in self.obstacles:
-            # Move with float, draw as int
-            obs["y"] += self.scroll_speed
-            y = obs["y"]
-
-            tile = obs["tile"]
-            tile.y = int(y)
-            tile.x = int(obs["x"])
-
-            # Check collision
-            if self._check_collision(obs):
-                self.game_over = True
-                return
-
-            # Off-screen?
-            if int(y) > self.height:
-                to_remove.append(obs)
-                if not obs["dodged"]:
-                    obs["dodged"] = True
-                    # +1 score for dodged obstacle
-                    self.score += 1
-                    self._update_name_score_label()
-
-                    self.dodged_count += 1
-                    if (self.dodged_count % 4 == 0) and (
-                        self.bullets < self.max_bullets
-                    ):
-                        self.bullets += 1
-                        self._update_bullet_display()
-
-        for obs in to_remove:
-            if obs in self.obstacles:
-                self.obstacles.remove(obs)
-                self.group.remove(obs["tile"])
+        # Move, collide and drop in one pass, compacting the arrays in place:
+        # slot i is copied down to slot `kept` once earlier slots were freed
+        kept = 0
+        hit = False
+        dodged = 0
+        for i in range(count):
+            if not hit:
+                # Move in Q4, draw whole pixels (x never changes after spawn);
+                # a sub-pixel step leaves the tile where it is
+                old_y = obs_y[i]
+                y = old_y + speed
+                obs_y[i] = y
+                oy = y >> 4
+                if oy != old_y >> 4:
+                    tiles[i].y = oy
+
+                # Collision with the 1-pixel-high obstacle rectangle; the row
+                # test goes first since it rejects all but the obstacles level
+                # with the player. The rest of the slots are kept as they are.
+                ox0 = obs_x[i]
+                if py0 <= oy < py1 and px0 < ox0 + obs_w[i] and px1 > ox0:
+                    hit = True
+
+                # Off-screen? Counted as dodged, scored after the loop
+                elif oy > height:
+                    self._free_obstacle(i)
+                    dodged += 1
+                    continue
+
+            if kept != i:
+                obs_y[kept] = obs_y[i]
+                obs_x[kept] = obs_x[i]
+                obs_w[kept] = obs_w[i]
+                tiles[kept] = tiles[i]
+            kept += 1
+
+        for i in range(kept, count):
+            tiles[i] = None
+        self.obs_count = kept
+        if hit:
+            self.game_over = True
+
+        # +1 score per dodged obstacle and a bullet every 4th dodge; the
+        # label and bullet bars are redrawn once however many left this frame
+        if dodged:
+            self.score += dodged
+            self._update_name_score_label()
+
+            bullets = self.bullets
+            for _ in range(dodged):
+                self.dodged_count += 1
+                if (self.dodged_count % 4 == 0) and (
+                    self.bullets < self.max_bullets
+                ):
+                    self.bullets += 1
+            if self.bullets != bullets:
+                self._update_bullet_display()
 
     # ------- public API -------
 
@@ -290,7 +413,7 @@ class Game:
         if delta == 0:
             return
 
-        self.player_x += float(delta * self.horizontal_step)
+        self.player_x += delta * self.horizontal_step
         self._update_player_pos()
 
     def handle_button_press(self):
@@ -303,11 +426,20 @@ class Game:
             return
         if self.bullets <= 0:
             return
-        if not self.obstacles:
+        count = self.obs_count
+        if not count:
             return
 
-        obs = self.obstacles.pop(0)
-        self.group.remove(obs["tile"])
+        # Drop the oldest obstacle (slot 0) and shift the others down
+        tiles = self.obs_tiles
+        self._free_obstacle(0)
+        for i in range(1, count):
+            self.obs_y[i - 1] = self.obs_y[i]
+            self.obs_x[i - 1] = self.obs_x[i]
+            self.obs_w[i - 1] = self.obs_w[i]
+            tiles[i - 1] = tiles[i]
+        tiles[count - 1] = None
+        self.obs_count = count - 1
         self.bullets -= 1
         self._update_bullet_display()
 
@@ -315,31 +447,33 @@ class Game:
         self.score += 1
         self._update_name_score_label()
 
-    def update(self, accel_y: float, now: float):
+    def update(self, accel_y: float, now_ms: int):
         """
         Called every frame from the main loop.
         Handles tilt-based vertical movement, spawning, and obstacle motion.
+        now_ms is integer milliseconds (time.monotonic_ns() // 1_000_000):
+        unlike float seconds it never loses resolution on long uptimes.
         """
         if self.game_over:
             return
 
-        self.frame_count += 1
-
         # Tilt-based vertical movement with cooldown
-        if now - self.last_tilt_time > self.tilt_cooldown:
+        if now_ms - self.last_tilt_ms > self.tilt_cooldown_ms:
             if accel_y < -self.tilt_threshold:
                 if self.vertical_level < 2:
                     self.vertical_level += 1
-                    self.last_tilt_time = now
+                    self.last_tilt_ms = now_ms
+                    self._update_player_pos()
             elif accel_y > self.tilt_threshold:
                 if self.vertical_level > 0:
                     self.vertical_level -= 1
-                    self.last_tilt_time = now
-
-            self._update_player_pos()
+                    self.last_tilt_ms = now_ms
+                    self._update_player_pos()
 
         # Spawn obstacles periodically
-        if self.spawn_interval > 0 and (self.frame_count % self.spawn_interval == 0):
+        self.spawn_countdown -= 1
+        if self.spawn_countdown == 0:
+            self.spawn_countdown = self.spawn_interval
             self._spawn_obstacle()
 
         # Move / remove / collide
@@ -8,10 +8,26 @@ DIFFICULTY_OPTIONS = ["Easy", "Medium", "Hard"]
 GAME_OVER_OPTIONS = ["Restart", "Main"]
 
 LEVEL_COUNT = 10  # 10 levels per difficulty
+HIGH_SCORE_ROWS = 5  # top 5 scores per level
+
+# Index of the first option label inside each screen's group
+# (title + subtitle come first on the main and difficulty menus).
+MAIN_MENU_FIRST_ITEM = 2
+DIFFICULTY_FIRST_ITEM = 2
+LEVEL_TITLE_INDEX = 0
+LEVEL_LABEL_INDEX = 2
+NAME_ENTRY_NAME_INDEX = 2
+NAME_ENTRY_CHAR_INDEX = 4
+GAME_OVER_SCORE_INDEX = 1
+GAME_OVER_FIRST_ROW = 3
+
+# terminalio.FONT is fixed width; used to place labels after a static prefix
+GLYPH_WIDTH = terminalio.FONT.get_bounding_box()[0]
 
 
 def clear_group(group: displayio.Group) -> None:
-    while len(group):
+    # Group has no slice delete; pop from the end, taking len() only once
+    for _ in range(len(group)):
         group.pop()
 
 
@@ -54,6 +70,43 @@ def show_main_menu(group: displayio.Group, selected_index: int) -> None:
         group.append(item)
 
 
+def _set_text(item, text: str) -> None:
+    """
+    Mutate a prebuilt label only if its text really changes.
+    Mutating .text re-renders the glyphs and marks just that label's area
+    dirty, so displayio sends a small window instead of the whole frame.
+    """
+    if item.text != text:
+        item.text = text
+
+
+def _cursor_texts(options: list) -> list:
+    """Every option row's text for each cursor position: [selected][row]."""
+    return [
+        [("> " if i == selected else "  ") + option for i, option in enumerate(options)]
+        for selected in range(len(options))
+    ]
+
+
+# Built once at import so moving the cursor never builds strings
+MAIN_MENU_TEXTS = _cursor_texts(MAIN_MENU_OPTIONS)
+DIFFICULTY_TEXTS = _cursor_texts(DIFFICULTY_OPTIONS)
+GAME_OVER_TEXTS = _cursor_texts(GAME_OVER_OPTIONS)
+HIGH_SCORE_PREFIXES = tuple(str(i + 1) + ". " for i in range(HIGH_SCORE_ROWS))
+LEVEL_TEXTS = ["> Level " + str(n) + "/" + str(LEVEL_COUNT) for n in range(1, LEVEL_COUNT + 1)]
+
+
+def _set_cursor(group, first_item, texts) -> None:
+    """Rewrite only the option rows whose cursor changed (normally two)."""
+    for i, text in enumerate(texts):
+        _set_text(group[first_item + i], text)
+
+
+def update_main_menu_selection(group: displayio.Group, selected_index: int) -> None:
+    """Move the cursor on a main menu already drawn by show_main_menu."""
+    _set_cursor(group, MAIN_MENU_FIRST_ITEM, MAIN_MENU_TEXTS[selected_index])
+
+
 def show_difficulty_menu(group: displayio.Group, selected_index: int) -> None:
     clear_group(group)
 
@@ -75,6 +128,11 @@ def show_difficulty_menu(group: displayio.Group, selected_index: int) -> None:
         group.append(item)
 
 
+def update_difficulty_selection(group: displayio.Group, selected_index: int) -> None:
+    """Move the cursor on a difficulty menu already drawn by show_difficulty_menu."""
+    _set_cursor(group, DIFFICULTY_FIRST_ITEM, DIFFICULTY_TEXTS[selected_index])
+
+
 def show_level_menu(
     group: displayio.Group,
     difficulty_name: str,
@@ -117,6 +175,16 @@ def show_level_menu(
     group.append(hint)
 
 
+def update_level_selection(group: displayio.Group, level_index: int) -> None:
+    """Change only the "> Level n/10" line of an already-drawn level menu."""
+    _set_text(group[LEVEL_LABEL_INDEX], LEVEL_TEXTS[level_index])
+
+
+def update_level_menu_difficulty(group: displayio.Group, difficulty_name: str) -> None:
+    """Retitle an already-drawn level menu for another difficulty."""
+    _set_text(group[LEVEL_TITLE_INDEX], difficulty_name + " Levels")
+
+
 def show_name_entry(
     group: displayio.Group,
     current_name: str,
@@ -128,21 +196,30 @@ def show_name_entry(
     title = label.Label(terminalio.FONT, text="Enter Name", x=18, y=10)
     group.append(title)
 
+    # The "Name: " / "Char: [" / "]" parts never change, so they get their
+    # own labels and a keypress only re-renders the short value labels.
+    # terminalio is fixed width, so the values line up by character count.
+    name_prefix = label.Label(terminalio.FONT, text="Name: ", x=4, y=26)
+    group.append(name_prefix)
     name_label = label.Label(
         terminalio.FONT,
-        text="Name: {}".format(current_name),
-        x=4,
+        text=current_name,
+        x=4 + 6 * GLYPH_WIDTH,
         y=26,
     )
     group.append(name_label)
 
+    char_prefix = label.Label(terminalio.FONT, text="Char: [", x=4, y=40)
+    group.append(char_prefix)
     char_label = label.Label(
         terminalio.FONT,
-        text="Char: [{}]".format(current_char),
-        x=4,
+        text=current_char,
+        x=4 + 7 * GLYPH_WIDTH,
         y=40,
     )
     group.append(char_label)
+    char_suffix = label.Label(terminalio.FONT, text="]", x=4 + 8 * GLYPH_WIDTH, y=40)
+    group.append(char_suffix)
 
     hint1 = label.Label(
         terminalio.FONT,
@@ -153,6 +230,16 @@ def show_name_entry(
     group.append(hint1)
 
 
+def update_name_entry(
+    group: displayio.Group,
+    current_name: str,
+    current_char: str,
+) -> None:
+    """Change the name / letter lines of an already-drawn name entry screen."""
+    _set_text(group[NAME_ENTRY_NAME_INDEX], current_name)
+    _set_text(group[NAME_ENTRY_CHAR_INDEX], current_char)
+
+
 def show_game_over_menu(
     group: displayio.Group,
     selected_index: int,
@@ -180,16 +267,14 @@ def show_game_over_menu(
     )
     group.append(hs_title)
 
-    # Show up to top 5 scores for this level
+    # Always create all 5 score rows (blank when unused) so the layout
+    # is fixed and the screen can be updated in place later
     y_base = 36
     spacing = 8
-    for i, entry in enumerate(high_scores[:5]):
-        name = entry.get("name", "")[:5]  # shorten long names
-        score = entry.get("score", 0)
-        line_text = "{}. {} {}".format(i + 1, name, score)
+    for i in range(HIGH_SCORE_ROWS):
         line = label.Label(
             terminalio.FONT,
-            text=line_text,
+            text=_high_score_text(i, high_scores),
             x=4,
             y=y_base + i * spacing,
         )
@@ -208,3 +293,61 @@ def show_game_over_menu(
         )
         group.append(item)
 
+
+def _high_score_text(i: int, high_scores: list) -> str:
+    if i >= len(high_scores):
+        return ""
+    name, score = high_scores[i]
+    if len(name) > 5:
+        name = name[:5]  # shorten long names
+    return HIGH_SCORE_PREFIXES[i] + name + " " + str(score)
+
+
+def update_game_over_selection(group: displayio.Group, selected_index: int) -> None:
+    """
+    Move the cursor on an already-drawn game over screen.
+    The Restart/Main options are always the last labels in the group.
+    """
+    first_item = len(group) - len(GAME_OVER_OPTIONS)
+    _set_cursor(group, first_item, GAME_OVER_TEXTS[selected_index])
+
+
+def update_game_over_scores(
+    group: displayio.Group,
+    player_score: int,
+    high_scores: list,
+) -> None:
+    """Fill an already-drawn game over screen with a new round's scores."""
+    _set_text(group[GAME_OVER_SCORE_INDEX], "You: " + str(player_score))
+    for i in range(HIGH_SCORE_ROWS):
+        _set_text(group[GAME_OVER_FIRST_ROW + i], _high_score_text(i, high_scores))
+
+
+def build_menus() -> dict:
+    """
+    Build every menu screen once at startup.
+    code.py shows one by assigning it to display.root_group and then only
+    mutates the labels that change, so no screen is ever rebuilt.
+    """
+    main = displayio.Group()
+    show_main_menu(main, 0)
+
+    difficulty = displayio.Group()
+    show_difficulty_menu(difficulty, 0)
+
+    level = displayio.Group()
+    show_level_menu(level, DIFFICULTY_OPTIONS[0], 0)
+
+    name_entry = displayio.Group()
+    show_name_entry(name_entry, "", "A")
+
+    game_over = displayio.Group()
+    show_game_over_menu(game_over, 0, 0, [])
+
+    return {
+        "main": main,
+        "difficulty": difficulty,
+        "level": level,
+        "name_entry": name_entry,
+        "game_over": game_over,
+    }